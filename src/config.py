@@ -10,3 +10,6 @@ DATA_DIR = PROJECT_DIR / "data"
 RAW_DIR = DATA_DIR / "raw"
 PROCESSED_DIR = DATA_DIR / "processed"
 API_KEY = os.getenv("API_KEY", "")
+
+# Column types for data/raw/dataset.csv (Arrow type aliases); columns not listed here, or absent from the file, are left to inference
+RAW_SCHEMA = {"Country": "string", "Year": "int16", "Value": "float32"}
@@ -1,6 +1,38 @@
-import pandas as pd
+import os
+from pathlib import Path
 
-from src.config import PROCESSED_DIR, RAW_DIR
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from src.config import PROCESSED_DIR, RAW_DIR, RAW_SCHEMA
+
+# Rows per Parquet row group
+ROW_GROUP_SIZE = 128_000
+
+
+def csv_to_parquet(raw_csv: Path, out: Path) -> None:
+    """Convert raw_csv to out through Arrow. Writes to a temp file first, so a bad input never replaces or truncates out."""
+    tmp = out.with_name(out.name + ".tmp")
+    try:
+        # Whole-file Arrow read: types are inferred across every block (not just the first), with no pandas round-trip.
+        # Known columns get explicit types; any other columns are kept and inferred as usual.
+        convert_options = pv.ConvertOptions(column_types={col: pa.type_for_alias(typ) for col, typ in RAW_SCHEMA.items()})
+        table = pv.read_csv(raw_csv, convert_options=convert_options)
+        # Dictionary encoding + statistics keep repeated Country values small and allow Year/Country pushdown.
+        pq.write_table(
+            table,
+            tmp,
+            row_group_size=ROW_GROUP_SIZE,
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            write_statistics=True,
+        )
+        os.replace(tmp, out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def main() -> None:
@@ -9,11 +41,8 @@ def main() -> None:
 
     raw_csv = RAW_DIR / "dataset.csv"
     if raw_csv.exists():
-        df = pd.read_csv(raw_csv)
         out = PROCESSED_DIR / "dataset.parquet"
-        if out.exists():
-            out.unlink()
-        df.to_parquet(out)
+        csv_to_parquet(raw_csv, out)
         print(f"Processed saved: {out}")
     else:
         print(f"Missing: {raw_csv}")
@@ -0,0 +1,415 @@
+# utils_country.py
+# Country name standardization for cross-dataset consistency
+# Output target: "Country" column with canonical English names
+
+import re
+import unicodedata
+from functools import lru_cache, reduce
+
+import numpy as np
+import pandas as pd
+
+# --- 1) Text normalization helpers ---
+
+_PUNCT_RX = re.compile(r"[^\w\s]", flags=re.UNICODE)
+
+# ASCII fast path for lower() + _PUNCT_RX in one str.translate: A-Z -> a-z, punctuation -> space
+_ASCII_LOWER_PUNCT_TABLE = {c: ord(" ") for c in range(128) if not (chr(c).isalnum() or chr(c) == "_" or chr(c).isspace())}
+_ASCII_LOWER_PUNCT_TABLE.update({c: c + 32 for c in range(ord("A"), ord("Z") + 1)})
+
+
+class _CombiningTable(dict):
+    """str.translate table that drops combining marks (accents/diacritics), filled lazily per code point."""
+
+    def __missing__(self, c: int) -> int | None:
+        self[c] = None if unicodedata.combining(chr(c)) else c
+        return self[c]
+
+
+_COMBINING_TABLE = _CombiningTable()
+
+
+def strip_accents(s: str) -> str:
+    """Remove accents/diacritics without changing letters."""
+    if s is None:
+        return s
+    if s.isascii():
+        return s
+    return unicodedata.normalize("NFKD", s).translate(_COMBINING_TABLE)
+
+
+# WB/UN abbreviations expanded by _post_token_rules, keyed by the matched token
+# with whitespace removed (so "fed sts" and "fedsts" share an entry).
+_TOKEN_SUBS = {
+    "dem": "democratic",
+    "rep": "republic",
+    "fed": "federal",
+    "fedsts": "federated states",
+    "fedstates": "federated states",
+}
+# One alternation for all abbreviations; longer forms first so "fed sts" wins over "fed"
+_TOKEN_RX = re.compile(r"\b(?:fed\s*states|fed\s*sts|dem|rep|fed)\b")
+
+
+def _expand_token(m: re.Match) -> str:
+    return _TOKEN_SUBS["".join(m.group(0).split())]
+
+
+def _post_token_rules(s: str) -> str:
+    """
+    Extra WB/UN harmonization rules applied after basic normalization.
+    Handle common abbreviations and patterns (no punctuation at this point).
+    """
+    # unify connectors
+    s = s.replace("&", "and")
+
+    # expand common abbreviations in a single scan, e.g.
+    # "dem peoples rep of korea" -> "democratic peoples republic of korea"
+    # "micronesia fed sts" -> "micronesia federated states"
+    s = _TOKEN_RX.sub(_expand_token, s)
+
+    # collapse spaces
+    return " ".join(s.split())
+
+
+@lru_cache(maxsize=4096)
+def normalize_token(s: str) -> str:
+    """Lowercase, strip accents, remove punctuation, collapse whitespace, then WB/UN rules."""
+    s = (s or "").strip()
+    if s.isascii():
+        # Nothing to decompose: lowercase + punctuation in one translate
+        s = s.translate(_ASCII_LOWER_PUNCT_TABLE)
+    else:
+        s = strip_accents(s).lower()
+        s = _PUNCT_RX.sub(" ", s)  # remove punctuation/symbols (., ’, , ... & etc.)
+    s = " ".join(s.split())  # collapse spaces
+    s = _post_token_rules(s)
+    return s
+
+
+# --- 2) Canonical name mapping ---
+# Left side: alias already in normalize_token() form (lowercase, ASCII, no punctuation, abbreviations expanded)
+# Right side: canonical "Country" (English)
+ALIAS = {
+    # Turkey
+    "turkiye": "Turkey",
+    "turkiye cumhuriyeti": "Turkey",
+    "republic of turkey": "Turkey",
+    "turkey": "Turkey",
+    # Czechia
+    "czech republic": "Czechia",
+    "czechia": "Czechia",
+    # Russia
+    "russian federation": "Russia",
+    "russia": "Russia",
+    # Vietnam
+    "viet nam": "Vietnam",
+    "vietnam": "Vietnam",
+    # Syria
+    "syrian arab republic": "Syria",
+    "syria": "Syria",
+    # Iran
+    "iran islamic republic": "Iran",
+    "iran islamic republic of": "Iran",
+    "islamic republic of iran": "Iran",
+    "iran": "Iran",
+    # Laos
+    "lao pdr": "Laos",
+    "lao people s democratic republic": "Laos",
+    "laos": "Laos",
+    # Gambia
+    "gambia the": "Gambia",
+    "the gambia": "Gambia",
+    "gambia": "Gambia",
+    # Bahamas
+    "bahamas the": "Bahamas",
+    "the bahamas": "Bahamas",
+    "bahamas": "Bahamas",
+    # Slovakia
+    "slovak republic": "Slovakia",
+    "slovakia": "Slovakia",
+    # Somalia
+    "somalia federal republic": "Somalia",
+    "somalia": "Somalia",
+    # St. Kitts and Nevis
+    "st kitts and nevis": "St. Kitts and Nevis",
+    "saint kitts and nevis": "St. Kitts and Nevis",
+    # St. Lucia
+    "st lucia": "St. Lucia",
+    "saint lucia": "St. Lucia",
+    # St. Vincent and the Grenadines
+    "st vincent and the grenadines": "St. Vincent and the Grenadines",
+    "saint vincent and the grenadines": "St. Vincent and the Grenadines",
+    # Cabo Verde
+    "cabo verde": "Cabo Verde",
+    "cape verde": "Cabo Verde",
+    # Côte d’Ivoire
+    "cote d ivoire": "Côte d’Ivoire",
+    "ivory coast": "Côte d’Ivoire",
+    "ivory coast cote d ivoire": "Côte d’Ivoire",
+    # Eswatini
+    "eswatini": "Eswatini",
+    "swaziland": "Eswatini",
+    # Myanmar
+    "myanmar": "Myanmar",
+    "burma": "Myanmar",
+    # Timor-Leste
+    "timor leste": "Timor-Leste",
+    "east timor": "Timor-Leste",
+    # Brunei
+    "brunei darussalam": "Brunei",
+    "brunei": "Brunei",
+    # Congo (DRC)
+    "democratic republic of the congo": "Congo (Democratic Republic of the)",
+    "congo democratic republic of the": "Congo (Democratic Republic of the)",
+    "congo democratic republic": "Congo (Democratic Republic of the)",
+    "dr congo": "Congo (Democratic Republic of the)",
+    "drc": "Congo (Democratic Republic of the)",
+    # Congo (Republic)
+    "republic of the congo": "Congo",
+    "congo republic": "Congo",
+    "congo": "Congo",
+    # Korea (South)
+    "korea republic": "Korea, Republic of",
+    "republic of korea": "Korea, Republic of",
+    "south korea": "Korea, Republic of",
+    "korea republic of": "Korea, Republic of",
+    # Korea (North)
+    "korea democratic people s republic": "Korea, Democratic People’s Republic of",
+    "korea democratic people s republic of": "Korea, Democratic People’s Republic of",
+    "democratic people s republic of korea": "Korea, Democratic People’s Republic of",
+    "dpr korea": "Korea, Democratic People’s Republic of",
+    "dprk": "Korea, Democratic People’s Republic of",
+    "north korea": "Korea, Democratic People’s Republic of",
+    # Hong Kong / Macao
+    "china hong kong sar": "Hong Kong SAR, China",
+    "hong kong sar china": "Hong Kong SAR, China",
+    "hong kong": "Hong Kong SAR, China",
+    "china macao sar": "Macao SAR, China",
+    "macao sar china": "Macao SAR, China",
+    "macau": "Macao SAR, China",
+    "macao": "Macao SAR, China",
+    # Moldova
+    "republic of moldova": "Moldova",
+    "moldova": "Moldova",
+    # United States
+    "united states": "United States of America",
+    "united states of america": "United States of America",
+    "usa": "United States of America",
+    "u s a": "United States of America",
+    "u s": "United States of America",
+    # Venezuela
+    "venezuela bolivarian republic of": "Venezuela (Bolivarian Republic of)",
+    "venezuela rb": "Venezuela (Bolivarian Republic of)",
+    "venezuela": "Venezuela (Bolivarian Republic of)",
+    # United States Virgin Islands
+    "virgin islands u s": "United States Virgin Islands",
+    "united states virgin islands": "United States Virgin Islands",
+    "virgin islands us": "United States Virgin Islands",
+    # Yemen
+    "yemen republic": "Yemen",
+    "republic of yemen": "Yemen",
+    "yemen": "Yemen",
+    # Australia (quirky aggregates sometimes)
+    "australia new zealand": "Australia",
+    # United Kingdom
+    "united kingdom": "United Kingdom",
+    "uk": "United Kingdom",
+    "u k": "United Kingdom",
+    "great britain": "United Kingdom",
+    "britain": "United Kingdom",
+    # Palestine
+    "state of palestine": "Palestine",
+    "west bank and gaza": "Palestine",
+    "palestine": "Palestine",
+    # Territories / special cases
+    "cocos keeling islands": "Cocos (Keeling) Islands",
+    "micronesia federated states of": "Micronesia, Federated States of",
+    "micronesia federated states": "Micronesia, Federated States of",
+    # North Macedonia
+    "tfyr macedonia": "North Macedonia",
+    "north macedonia": "North Macedonia",
+    "macedonia the former yugoslav republic of": "North Macedonia",
+    # Bolivia, Tanzania (UN names)
+    "bolivia plurinational state of": "Bolivia (Plurinational State of)",
+    "bolivia": "Bolivia (Plurinational State of)",
+    "tanzania united republic of": "Tanzania, United Republic of",
+    "united republic of tanzania": "Tanzania, United Republic of",
+    "tanzania": "Tanzania, United Republic of",
+    # Bahrain (TR spelling)
+    "bahrein": "Bahrain",
+    "bahrain": "Bahrain",
+    # WB ↔ UN harmonization
+    "egypt arab republic": "Egypt",
+    "egypt arab republic of": "Egypt",
+    "arab republic of egypt": "Egypt",
+    "egypt": "Egypt",
+    "curacao": "Curaçao",
+    "faroe islands": "Faroe Islands",
+    "faeroe islands": "Faroe Islands",
+    "kyrgyz republic": "Kyrgyzstan",
+    "kyrgyzstan": "Kyrgyzstan",
+    "puerto rico": "Puerto Rico",
+    "puerto rico us": "Puerto Rico",
+    # A few UN territories often appearing
+    "falkland islands malvinas": "Falkland Islands (Malvinas)",
+    "holy see": "Holy See",
+    "guadeloupe": "Guadeloupe",
+    "martinique": "Martinique",
+    "mayotte": "Mayotte",
+    "french guiana": "French Guiana",
+    "montserrat": "Montserrat",
+    "melanesia": "Melanesia",
+}
+
+# Canonical names map to themselves; lets already-standardized data skip normalization
+_CANONICAL_OUTPUTS = frozenset(ALIAS.values())
+
+# Region/aggregate hints (drop_non_countries already handles these, but we avoid remapping)
+AGGREGATE_HINTS = {
+    "world": "World",
+    "euro area": "Euro area",
+    "europe": "Europe",
+    "sub saharan": "Sub-Saharan Africa",
+    "latin america": "Latin America & Caribbean",
+    "east asia": "East Asia & Pacific",
+    "south asia": "South Asia",
+    "middle east": "Middle East & North Africa",
+    "ibrd": "IBRD",
+    "ida": "IDA",
+    "oecd": "OECD",
+    "income": "income",
+    "demographic dividend": "demographic dividend",
+}
+_AGG_RX = re.compile("|".join(re.escape(a) for a in AGGREGATE_HINTS))
+
+
+def _resolve(raw: str) -> str:
+    """Canonical form of an already-trimmed name; shared by canonical_country and standardize_country_column."""
+    if raw in _CANONICAL_OUTPUTS:
+        return raw
+    key = normalize_token(raw)
+
+    # Handle "the ..." patterns (e.g., 'the bahamas', 'the gambia')
+    if key.startswith("the "):
+        key = key[4:]
+
+    # Direct alias hit (normalized)
+    if key in ALIAS:
+        return ALIAS[key]
+
+    # Looks like an aggregate? keep original (drop step removes)
+    if _AGG_RX.search(key):
+        return raw
+
+    # Default: return original trimmed
+    return raw
+
+
+def canonical_country(name: str) -> str:
+    """Map input country name to canonical form if possible; otherwise return trimmed original."""
+    if pd.isna(name):
+        return name
+    return _resolve(str(name).strip())
+
+
+def standardize_country_column(df: pd.DataFrame, col: str = "Country", copy: bool = True) -> pd.DataFrame:
+    """
+    Return a copy where df[col] is canonicalized.
+    With copy=False, df[col] is overwritten in place and df itself is returned.
+    """
+    if col not in df.columns:
+        return df
+    out = df.copy() if copy else df
+    # Country columns repeat the same few hundred names: resolve each distinct value once,
+    # then broadcast back through the integer codes (trailing NaN slot catches code -1)
+    values = out[col]
+    if pd.api.types.infer_dtype(values, skipna=True) != "string":
+        # factorize hashes by equality (1 == 1.0 == True), so stringify first to keep each value's own text
+        values = values.where(values.isna(), values.astype(str))
+    codes, uniques = pd.factorize(values)
+    raw = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    # Already-canonical names (e.g. re-running on standardized data) resolve to themselves; skip them in one pass
+    mapped = np.append(raw.to_numpy(dtype=object), np.nan)
+    todo = ~raw.isin(_CANONICAL_OUTPUTS).to_numpy()
+    mapped[:-1][todo] = [_resolve(r) for r in mapped[:-1][todo]]
+    out[col] = mapped[codes]
+    return out
+
+
+def standardize_and_keep_common(dfs, col: str = "Country", with_report: bool = False):
+    """
+    Standardize df[col] in every frame, then keep only the values present in all of them.
+    Returns (filtered, common), plus a per-frame list of dropped values if with_report=True.
+    Note: df[col] of each input frame is canonicalized in place; the filtered frames are new copies.
+    """
+    if not dfs:
+        raise ValueError("Need at least one dataframe to compute common countries.")
+    # Filtering below already materializes new frames, so skip the intermediate copy
+    standardized = [standardize_country_column(df, col, copy=False) for df in dfs]
+
+    # Distinct values per frame, computed once and reused for the intersection and the report.
+    # Hashtable-backed Index ops instead of Python sets; intersect smallest-first and stop once empty
+    uniques = [pd.Index(df[col].dropna().unique()) for df in standardized]
+    common_idx = reduce(lambda a, b: a.intersection(b, sort=False) if len(a) else a, sorted(uniques, key=len))
+
+    # Boolean .loc already returns a new frame; no extra .copy() needed
+    filtered = [df.loc[df[col].isin(common_idx)] for df in standardized]
+    common = set(common_idx)
+    if not with_report:
+        return filtered, common
+
+    report = [sorted(idx.difference(common_idx, sort=False)) for idx in uniques]
+    return filtered, common, report
+
+
+# Broader aggregate heuristic used only for reporting (regions, income groups, ...)
+_REPORT_AGG_RX = re.compile(
+    r"world|income|area|region|europe|asia|africa|america|caribbean|sub saharan"
+    r"|middle east|north africa"
+    r"|east asia|south asia|pacific|latin america|oecd|ibrd|ida|demographic dividend",
+    flags=re.I,
+)
+
+
+def report_unmapped(df: pd.DataFrame, col: str = "Country", sample=30):
+    """Quick check for values that might still need mapping."""
+    ser = df[col].astype(str)
+    # Normalize each distinct value once, then broadcast back to rows
+    uniq = ser.unique()
+    norm = {u: normalize_token(u) for u in uniq}
+    canon = {u: ALIAS.get(norm[u]) for u in uniq}
+    pairs = pd.DataFrame(
+        {
+            "original": ser,
+            "normalized": ser.map(norm),
+            "canonical": ser.map(canon),
+        }
+    )
+    unmapped = pairs[pairs["canonical"].isna()]
+    # Ignore aggregates heuristically
+    mask_agg = unmapped["normalized"].str.contains(_REPORT_AGG_RX, regex=True)
+    unmapped = unmapped.loc[~mask_agg, ["original"]].drop_duplicates().head(sample)
+    return unmapped
+
+
+if __name__ == "__main__":
+    # quick self-test
+    tests = [
+        "Korea, Democratic People's Republic of",
+        "Dem. People's Republic of Korea",
+        "DPRK",
+        "DPR Korea",
+        "Micronesia, Fed. Sts.",
+        "Egypt, Arab Rep.",
+        "Curaçao",
+        "Curacao",
+        "Faeroe Islands",
+        "Faroe Islands",
+        "Saint Lucia",
+        "St. Lucia",
+        "Gambia, The",
+        "The Bahamas",
+    ]
+    df = pd.DataFrame({"Country": tests})
+    print(standardize_country_column(df))
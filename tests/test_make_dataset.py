@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.data import make_dataset
+
+
+def _write_csv(path: Path, n_rows: int, bad_row: int | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ["Country,Year,Value"]
+    for i in range(n_rows):
+        year = "not-a-year" if i == bad_row else str(1960 + i % 59)
+        lines.append(f"{('Turkey', 'Germany', 'Chad')[i % 3]},{year},{i % 7 / 2}")
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    raw_dir, processed_dir = tmp_path / "raw", tmp_path / "processed"
+    monkeypatch.setattr(make_dataset, "RAW_DIR", raw_dir)
+    monkeypatch.setattr(make_dataset, "PROCESSED_DIR", processed_dir)
+    return raw_dir, processed_dir
+
+
+def test_main_converts_csv(dirs: tuple[Path, Path]) -> None:
+    raw_dir, processed_dir = dirs
+    _write_csv(raw_dir / "dataset.csv", 10)
+    make_dataset.main()
+    df = pd.read_parquet(processed_dir / "dataset.parquet")
+    assert len(df) == 10
+    assert df["Country"].tolist()[:3] == ["Turkey", "Germany", "Chad"]
+    assert list(processed_dir.iterdir()) == [processed_dir / "dataset.parquet"]
+
+
+def test_main_infers_types_past_first_block(dirs: tuple[Path, Path]) -> None:
+    raw_dir, processed_dir = dirs
+    raw_dir.mkdir(parents=True)
+    # Integers for well over one 1 MB CSV block, then a float
+    rows = "".join(f"Chad,{i}\n" for i in range(200_000)) + "Peru,1.5\n"
+    (raw_dir / "dataset.csv").write_text("Country,Pop\n" + rows)
+    make_dataset.main()
+    df = pd.read_parquet(processed_dir / "dataset.parquet")
+    assert len(df) == 200_001
+    assert df["Pop"].iloc[-1] == 1.5
+
+
+def test_main_applies_schema_and_keeps_other_columns(dirs: tuple[Path, Path]) -> None:
+    raw_dir, processed_dir = dirs
+    raw_dir.mkdir(parents=True)
+    # World Bank wide layout: no Year/Value columns, one column per year.
+    # 1960 stays empty for more than one 1 MB CSV block before its first value appears.
+    rows = "Chad,TCD,,6.2\n" * 150_000 + "Turkey,TUR,5.5,6.3\n"
+    (raw_dir / "dataset.csv").write_text("Country,Country Code,1960,1961\n" + rows)
+    make_dataset.main()
+    schema = pq.read_schema(processed_dir / "dataset.parquet")
+    assert schema.names == ["Country", "Country Code", "1960", "1961"]
+    assert schema.field("Country").type == pa.string()
+    df = pd.read_parquet(processed_dir / "dataset.parquet")
+    assert len(df) == 150_001
+    assert df["1960"].iloc[-1] == 5.5
+
+    _write_csv(raw_dir / "dataset.csv", 10)
+    make_dataset.main()
+    schema = pq.read_schema(processed_dir / "dataset.parquet")
+    assert schema.field("Year").type == pa.int16()
+    assert schema.field("Value").type == pa.float32()
+
+
+def test_main_writes_fixed_size_zstd_row_groups(dirs: tuple[Path, Path]) -> None:
+    raw_dir, processed_dir = dirs
+    _write_csv(raw_dir / "dataset.csv", 2 * make_dataset.ROW_GROUP_SIZE + 44_001)
+    make_dataset.main()
+    metadata = pq.ParquetFile(processed_dir / "dataset.parquet").metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert sizes == [make_dataset.ROW_GROUP_SIZE, make_dataset.ROW_GROUP_SIZE, 44_001]
+    for i in range(metadata.num_row_groups):
+        for j in range(metadata.num_columns):
+            column = metadata.row_group(i).column(j)
+            assert column.compression == "ZSTD"
+            assert column.statistics.has_min_max
+
+
+def test_main_keeps_previous_output_on_bad_input(dirs: tuple[Path, Path]) -> None:
+    raw_dir, processed_dir = dirs
+    _write_csv(raw_dir / "dataset.csv", 10)
+    make_dataset.main()
+    before = (processed_dir / "dataset.parquet").read_bytes()
+
+    # Bad Year (explicitly typed int16) far past the first 1 MB block
+    _write_csv(raw_dir / "dataset.csv", 400_000, bad_row=399_997)
+    with pytest.raises(pa.ArrowInvalid):
+        make_dataset.main()
+    assert (processed_dir / "dataset.parquet").read_bytes() == before
+    assert list(processed_dir.iterdir()) == [processed_dir / "dataset.parquet"]
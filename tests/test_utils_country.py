@@ -0,0 +1,134 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from src import utils_country
+from src.utils_country import ALIAS, canonical_country, normalize_token, report_unmapped, standardize_and_keep_common, standardize_country_column
+
+# Same inputs as the module's __main__ self-test
+SELF_TEST = [
+    ("Korea, Democratic People's Republic of", "Korea, Democratic People’s Republic of"),
+    ("Dem. People's Republic of Korea", "Korea, Democratic People’s Republic of"),
+    ("DPRK", "Korea, Democratic People’s Republic of"),
+    ("DPR Korea", "Korea, Democratic People’s Republic of"),
+    ("Micronesia, Fed. Sts.", "Micronesia, Federated States of"),
+    ("Egypt, Arab Rep.", "Egypt"),
+    ("Curaçao", "Curaçao"),
+    ("Curacao", "Curaçao"),
+    ("Faeroe Islands", "Faroe Islands"),
+    ("Faroe Islands", "Faroe Islands"),
+    ("Saint Lucia", "St. Lucia"),
+    ("St. Lucia", "St. Lucia"),
+    ("Gambia, The", "Gambia"),
+    ("The Bahamas", "Bahamas"),
+]
+
+
+@pytest.mark.parametrize("name, expected", SELF_TEST)
+def test_canonical_country(name: str, expected: str) -> None:
+    assert canonical_country(name) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("Türkiye", "turkiye"),
+        ("Korea, Dem. People’s Rep.", "korea democratic people s republic"),
+        ("Micronesia, Fed. Sts.", "micronesia federated states"),
+        ("Somalia, Fed. Rep.", "somalia federal republic"),
+        ("  Côte d’Ivoire ", "cote d ivoire"),
+        ("", ""),
+    ],
+)
+def test_normalize_token(raw: str, expected: str) -> None:
+    assert normalize_token(raw) == expected
+
+
+def test_alias_keys_are_normalized() -> None:
+    assert [k for k in ALIAS if normalize_token(k) != k] == []
+
+
+def test_canonical_names_map_to_themselves() -> None:
+    # Check the alias lookup itself, bypassing the canonical-name short-circuit
+    assert [v for v in set(ALIAS.values()) if ALIAS.get(normalize_token(v).removeprefix("the "), v) != v] == []
+
+
+def test_scalar_and_column_paths_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    # An alias that remaps a canonical name must resolve the same way on both paths
+    monkeypatch.setitem(ALIAS, "australia", "Oceania")
+    names = [name for name, _ in SELF_TEST] + ["Australia", " the gambia ", "Euro area", "Atlantis"]
+    out = standardize_country_column(pd.DataFrame({"Country": names}))
+    assert out["Country"].tolist() == [canonical_country(name) for name in names]
+
+
+def test_standardize_skips_normalizing_canonical_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(utils_country, "normalize_token", lambda s: calls.append(s) or s)
+    df = pd.DataFrame({"Country": ["Turkey", "Vietnam", "Turkey", "Korea, Republic of", None]})
+    out = standardize_country_column(df)
+    assert out["Country"].iloc[:-1].tolist() == df["Country"].iloc[:-1].tolist()
+    assert calls == []
+
+
+def test_unknown_names_are_trimmed_not_mapped() -> None:
+    assert canonical_country("  Germany ") == "Germany"
+    assert canonical_country("Euro area") == "Euro area"
+    assert pd.isna(canonical_country(None))
+
+
+def test_canonical_country_stringifies_non_strings() -> None:
+    assert canonical_country(1.0) == "1.0"
+    assert canonical_country(True) == "True"
+    assert canonical_country(["Chad"]) == "['Chad']"
+
+
+def test_standardize_country_column() -> None:
+    df = pd.DataFrame({"Country": [name for name, _ in SELF_TEST] + [None], "Year": range(len(SELF_TEST) + 1)})
+    out = standardize_country_column(df)
+    assert out is not df
+    assert out["Country"].iloc[:-1].tolist() == [expected for _, expected in SELF_TEST]
+    assert pd.isna(out["Country"].iloc[-1])
+    assert df["Country"].iloc[0] == SELF_TEST[0][0]
+
+
+def test_standardize_country_column_keeps_equal_non_strings_apart() -> None:
+    df = pd.DataFrame({"Country": pd.Series([1.0, True, 1, " Viet Nam", None], dtype=object)})
+    out = standardize_country_column(df)
+    assert out["Country"].iloc[:-1].tolist() == ["1.0", "True", "1", "Vietnam"]
+    assert out["Country"].iloc[:-1].tolist() == [canonical_country(v) for v in df["Country"].iloc[:-1]]
+    assert pd.isna(out["Country"].iloc[-1])
+
+
+def test_standardize_and_keep_common() -> None:
+    a = pd.DataFrame({"Country": ["Türkiye", "Germany", "World"], "Year": [2000, 2000, 2000]})
+    b = pd.DataFrame({"Country": ["Turkey", "Viet Nam", "Germany", "Germany"], "Year": [2000, 2000, 2000, 2001]})
+    filtered, common, report = standardize_and_keep_common([a, b], with_report=True)
+    assert common == {"Turkey", "Germany"}
+    assert filtered[0]["Country"].tolist() == ["Turkey", "Germany"]
+    assert filtered[1]["Country"].tolist() == ["Turkey", "Germany", "Germany"]
+    assert report == [["World"], ["Vietnam"]]
+
+
+def test_standardize_and_keep_common_without_overlap() -> None:
+    a = pd.DataFrame({"Country": ["Chad"], "Year": [2000]})
+    b = pd.DataFrame({"Country": ["Peru", "Fiji"], "Year": [2000, 2000]})
+    c = pd.DataFrame({"Country": ["Chad", "Peru", "Fiji"], "Year": [2000, 2000, 2000]})
+    filtered, common = standardize_and_keep_common([a, b, c])
+    assert common == set()
+    assert [len(df) for df in filtered] == [0, 0, 0]
+
+
+def test_standardize_and_keep_common_returns_independent_frames() -> None:
+    a = pd.DataFrame({"Country": ["Turkey", "Germany"], "Value": [1.0, 2.0]})
+    b = pd.DataFrame({"Country": ["Turkey"], "Value": [3.0]})
+    (fa, _), _ = standardize_and_keep_common([a, b])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fa["Value"] = 0.0
+    assert a["Value"].tolist() == [1.0, 2.0]
+
+
+def test_report_unmapped_skips_aggregates() -> None:
+    df = pd.DataFrame({"Country": ["Türkiye", "Atlantis", "Atlantis", "High income", "Euro area"]})
+    assert report_unmapped(df)["original"].tolist() == ["Atlantis"]